@@ -5,63 +5,366 @@ Converts PNG images to SVG format with optional background removal.
 """
 
 import argparse
+import functools
+import glob
+import io
 import os
 import sys
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Optional
 
 try:
+    import numpy as np
     import vtracer
-    from rembg import remove
-    from PIL import Image, ImageFilter, ImageEnhance
+    from rembg import new_session, remove
+    from scipy import ndimage
+    from PIL import Image
 except ImportError as e:
     print(f"Error: Missing required dependency: {e}")
     print("Please run: poetry install")
     sys.exit(1)
+else:
+    # Pillow-SIMD is a drop-in Pillow fork with SSE4/AVX2 kernels for
+    # resize/blur/sharpen; its version string carries a .postN suffix
+    if 'post' not in getattr(Image, '__version__', ''):
+        print("Tip: pip install pillow-simd for 4-6x faster image filters "
+              "(drop-in replacement for Pillow)")
+
+# Numba and numexpr are optional acceleration tiers; plain NumPy is
+# the baseline fallback
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = prange = None
+
+try:
+    import numexpr as ne
+except ImportError:
+    ne = None
+
+
+# BT.601 luma weights, matching PIL's YCbCr conversion
+_LUMA_WEIGHTS = np.array([0.299, 0.587, 0.114], dtype=np.float32)
+
+# Cached rembg session, created lazily as (model_name, session)
+_REMBG_SESSION = None
+
+# Reusable scratch arrays, keyed by name. Batch parallelism uses
+# processes, so each worker owns its own set; buffers stay warm in
+# cache across same-sized conversions instead of churning the allocator
+# with ~image-sized temporaries.
+_SCRATCH = {}
+
+
+def _scratch(key: str, shape: tuple, dtype) -> np.ndarray:
+    """Return a reusable scratch array, reallocating only on shape change."""
+    buf = _SCRATCH.get(key)
+    if buf is None or buf.shape != shape or buf.dtype != dtype:
+        buf = np.empty(shape, dtype=dtype)
+        _SCRATCH[key] = buf
+    return buf
+
+
+def _get_session(model: str):
+    """
+    Return a cached rembg session, creating it on first use.
+
+    Loading the ONNX model takes seconds while per-image inference is
+    ~100 ms, so reusing one session amortizes the model load across a
+    batch of conversions.
+    """
+    global _REMBG_SESSION
+    if _REMBG_SESSION is None or _REMBG_SESSION[0] != model:
+        _REMBG_SESSION = (model, new_session(model))
+    return _REMBG_SESSION[1]
+
+
+def _pil_to_np(img: Image.Image) -> np.ndarray:
+    """
+    View an RGBA PIL image as a (H, W, 4) uint8 array.
+
+    np.frombuffer wraps the raw bytes directly, so the only copy is
+    PIL's own tobytes() export; np.asarray can add a second copy on
+    some PIL versions depending on mode. The result is read-only.
+    """
+    w, h = img.size
+    return np.frombuffer(img.tobytes(), dtype=np.uint8).reshape(h, w, 4)
+
+
+def _np_to_pil(arr: np.ndarray, mode: str = 'RGBA') -> Image.Image:
+    """
+    Wrap a uint8 array as a PIL image through the raw decoder.
+
+    Image.frombuffer shares the array's memory for RGBA and skips
+    fromarray's dtype/shape detection; the caller must not mutate the
+    array afterwards.
+    """
+    h, w = arr.shape[:2]
+    return Image.frombuffer(mode, (w, h), np.ascontiguousarray(arr),
+                            'raw', mode, 0, 1)
+
+
+@functools.lru_cache(maxsize=8)
+def _gauss1d(sigma: float) -> np.ndarray:
+    """
+    Normalized 1D Gaussian weights for the given sigma, cached.
+
+    The coefficients only depend on sigma, which is a per-mode
+    constant, so building them once per session keeps the kernel
+    construction out of the per-image hot path. Radius and precision
+    match scipy's gaussian_filter1d defaults (truncate=4.0, float64
+    weights), so the output is identical to calling that directly.
+    """
+    radius = int(4.0 * sigma + 0.5)
+    x = np.arange(-radius, radius + 1)
+    weights = np.exp(-0.5 * (x / sigma) ** 2)
+    return weights / weights.sum()
+
+
+@functools.lru_cache(maxsize=8)
+def _saturation_matrix(sat: float) -> np.ndarray:
+    """
+    3x3 color matrix blending each channel toward BT.601 luma.
+
+    Equivalent to PIL's grayscale blend for saturation, but applied as
+    one BLAS-backed matmul over the flattened pixels.
+    """
+    blend = np.outer(np.ones(3, dtype=np.float32), _LUMA_WEIGHTS)
+    return ((1.0 - sat) * blend + sat * np.eye(3, dtype=np.float32)).astype(np.float32)
+
+
+@functools.lru_cache(maxsize=8)
+def _contrast_lut(factor: float) -> np.ndarray:
+    """
+    256-entry lookup table mapping uint8 luma to contrasted float32.
+
+    The contrast transform only has 256 possible inputs, so remapping
+    the whole plane is a single gather instead of per-pixel arithmetic.
+    Cached per factor, so repeated conversions reuse the table.
+    """
+    return (np.arange(256, dtype=np.float32) - 128.0) * factor + 128.0
+
+
+def _separable_gaussian(arr: np.ndarray, sigma: float,
+                        output: Optional[np.ndarray] = None) -> np.ndarray:
+    """Gaussian blur over the two spatial axes as two 1D passes.
+
+    A separable kernel costs O(2k·N) instead of O(k²·N) for the
+    equivalent 2D convolution, and skips the channel axis entirely.
+    The coefficient array comes from the per-sigma cache.
+    """
+    weights = _gauss1d(sigma)
+    blurred = ndimage.correlate1d(arr, weights, axis=0, output=output)
+    return ndimage.correlate1d(blurred, weights, axis=1, output=blurred)
+
+
+def _enhance_numpy(
+    arr: np.ndarray,
+    luma: np.ndarray,
+    contrasted: np.ndarray,
+    blurred: np.ndarray,
+    out: np.ndarray,
+    sat: float,
+    amount: float,
+    thresh: float,
+) -> None:
+    """Vectorized NumPy version of the enhancement kernel.
+
+    All heavy intermediates live in reused scratch buffers and every
+    step runs in place; the blurred plane is consumed as diff/delta
+    scratch along the way.
+    """
+    h, w = luma.shape
+    rgb = _scratch('rgb_f32', (h, w, 3), np.float32)
+    np.copyto(rgb, arr[..., :3])
+
+    # Unsharp mask on the contrasted luminance, skipping near-flat areas
+    enhanced = _scratch('enhanced_f32', (h, w), np.float32)
+    if ne is not None:
+        # numexpr fuses the masked update into one threaded SIMD pass
+        # with no boolean mask or fancy-indexing temporaries
+        ne.evaluate(
+            'where(abs(contrasted - blurred) > thresh,'
+            ' contrasted + amount * (contrasted - blurred), contrasted)',
+            out=enhanced, casting='same_kind')
+    else:
+        np.copyto(enhanced, contrasted)
+        diff = np.subtract(contrasted, blurred, out=blurred)
+        mask = np.abs(diff) > thresh
+        enhanced[mask] += amount * diff[mask]
+
+    # Saturate with one SGEMM against the cached 3x3 color matrix, then
+    # fold the luminance delta back in. Spreading the channels around
+    # the enhanced luminance reduces to gray-blend + delta because the
+    # luma weights sum to one.
+    delta = np.subtract(enhanced, luma, out=blurred)
+    if sat != 1.0:
+        mixed = _scratch('mixed_f32', (h, w, 3), np.float32)
+        np.matmul(rgb.reshape(-1, 3), _saturation_matrix(sat).T,
+                  out=mixed.reshape(-1, 3))
+        rgb = mixed
+    rgb += delta[..., None]
+
+    np.clip(rgb, 0, 255, out=rgb)
+    np.copyto(out[..., :3], rgb, casting='unsafe')
+    out[..., 3] = arr[..., 3]
+
+
+if njit is not None:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _enhance_kernel(arr, luma, contrasted, blurred, out, sat, amount, thresh):
+        # Same math as _enhance_numpy, but fused into one parallel pass
+        # over the pixels with no intermediate arrays.
+        h, w = luma.shape
+        for i in prange(h):
+            for j in range(w):
+                y = np.float32(luma[i, j])
+                e = contrasted[i, j]
+                d = e - blurred[i, j]
+                if abs(d) > thresh:
+                    e = e + amount * d
+                delta = e - y
+                for c in range(3):
+                    v = arr[i, j, c] + delta
+                    v = e + sat * (v - e)
+                    if v < 0.0:
+                        v = 0.0
+                    elif v > 255.0:
+                        v = 255.0
+                    out[i, j, c] = np.uint8(v)
+                out[i, j, 3] = arr[i, j, 3]
+
+    _enhance = _enhance_kernel
+else:
+    _enhance = _enhance_numpy
+
+
+def _preprocess_array(arr: np.ndarray, ultra_quality: bool = False) -> np.ndarray:
+    """
+    Run the quality-enhancement pipeline on an RGBA uint8 array.
+
+    Operating on arrays end to end lets the rembg output feed straight
+    into the enhancement kernel with no intermediate PIL images or
+    buffer copies.
+
+    Args:
+        arr: RGBA uint8 array of shape (H, W, 4)
+        ultra_quality: Apply maximum quality preprocessing
+
+    Returns:
+        Enhanced RGBA uint8 array
+    """
+    arr = np.ascontiguousarray(arr)
+
+    # Sharpen and contrast operate on the luminance plane only: a third
+    # of the arithmetic of per-channel filtering, and no color shift.
+    # float32 keeps well over 8 bits of precision through the
+    # intermediate math; chroma is left untouched.
+    if ultra_quality:
+        # Ultra quality mode: more aggressive unsharp mask, contrast
+        # and a slight saturation boost
+        contrast, sat, amount, thresh, sigma = 1.4, 1.1, 1.5, 3.0, 1.0
+    else:
+        # Standard quality mode: mild unsharp mask (replaces
+        # ImageFilter.SHARPEN) and a slight contrast boost
+        contrast, sat, amount, thresh, sigma = 1.2, 1.0, 1.0, 0.0, 0.7
+
+    # Build the uint8 luma plane with scratch accumulators: weighted
+    # channel sums written in place instead of a chain of temporaries
+    h, w = arr.shape[:2]
+    rgb = arr[..., :3]
+    luma_f = _scratch('luma_f32', (h, w), np.float32)
+    chan = _scratch('chan_f32', (h, w), np.float32)
+    np.multiply(rgb[..., 0], _LUMA_WEIGHTS[0], out=luma_f)
+    np.multiply(rgb[..., 1], _LUMA_WEIGHTS[1], out=chan)
+    luma_f += chan
+    np.multiply(rgb[..., 2], _LUMA_WEIGHTS[2], out=chan)
+    luma_f += chan
+    luma_f += 0.5
+    luma = _scratch('luma_u8', (h, w), np.uint8)
+    np.copyto(luma, luma_f, casting='unsafe')
+
+    # Contrast as a LUT gather on the uint8 luma plane: zero per-pixel
+    # arithmetic. Since the contrast map is affine and the blur is
+    # linear, contrasting before the unsharp step is equivalent to the
+    # old order once the threshold is scaled by the same factor.
+    contrasted = _scratch('contrasted_f32', (h, w), np.float32)
+    np.take(_contrast_lut(contrast), luma, out=contrasted)
+
+    # Single separable gaussian (one 1D pass per axis) feeds the
+    # unsharp mask; it subsumes the old GaussianBlur(0.5) pre-blur,
+    # which was a redundant extra convolution over the whole buffer.
+    blurred = _separable_gaussian(
+        contrasted, sigma, output=_scratch('blurred_f32', (h, w), np.float32))
+
+    out = np.empty_like(arr)
+    _enhance(arr, luma, contrasted, blurred, out, sat, amount, thresh * contrast)
+    return out
 
 
 def preprocess_image(img: Image.Image, enhance_edges: bool = True, ultra_quality: bool = False) -> Image.Image:
     """
     Preprocess image to improve vectorization quality.
-    
+
     Args:
         img: Input PIL Image
         enhance_edges: Whether to enhance edges
         ultra_quality: Apply maximum quality preprocessing
-    
+
     Returns:
         Processed PIL Image
     """
     # Convert to RGBA if not already
     if img.mode != 'RGBA':
         img = img.convert('RGBA')
-    
-    if enhance_edges:
-        if ultra_quality:
-            # Ultra quality mode: more aggressive preprocessing
-            # First, apply slight gaussian blur to reduce noise
-            img = img.filter(ImageFilter.GaussianBlur(radius=0.5))
-            
-            # Apply unsharp mask for better edge definition
-            img = img.filter(ImageFilter.UnsharpMask(radius=2, percent=150, threshold=3))
-            
-            # Enhance contrast more aggressively
-            enhancer = ImageEnhance.Contrast(img)
-            img = enhancer.enhance(1.4)
-            
-            # Enhance color saturation slightly
-            enhancer = ImageEnhance.Color(img)
-            img = enhancer.enhance(1.1)
-        else:
-            # Standard quality mode
-            # Slightly sharpen the image to get cleaner edges
-            img = img.filter(ImageFilter.SHARPEN)
-            
-            # Enhance contrast slightly
-            enhancer = ImageEnhance.Contrast(img)
-            img = enhancer.enhance(1.2)
-    
-    return img
+
+    if not enhance_edges:
+        return img
+
+    out = _preprocess_array(_pil_to_np(img), ultra_quality=ultra_quality)
+    return _np_to_pil(out)
+
+
+def _trace_image(img: Image.Image, output_path: str, params: dict) -> None:
+    """
+    Vectorize a PIL image with vtracer without touching the disk.
+
+    Encodes the image to an in-memory PNG and hands the bytes straight
+    to vtracer, skipping the temp-file write + read round-trip. Falls
+    back to a temporary file for vtracer builds without the raw-bytes
+    API.
+    """
+    if hasattr(vtracer, 'convert_raw_image_to_svg'):
+        buf = io.BytesIO()
+        img.save(buf, format='PNG')
+        svg_str = vtracer.convert_raw_image_to_svg(
+            buf.getvalue(), img_format='png', **params
+        )
+        # Large write buffer so multi-MB SVGs stream out in few
+        # syscalls; the fadvise hint keeps batch runs from filling the
+        # page cache with output we never read back
+        with open(output_path, 'w', buffering=1 << 20, encoding='utf-8',
+                  newline='') as f:
+            f.write(svg_str)
+            f.flush()
+            if hasattr(os, 'posix_fadvise'):
+                os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_DONTNEED)
+        return
+
+    # Keep the throwaway PNG on tmpfs when available so it never hits
+    # real storage, and barely compress it -- nothing reads it but
+    # vtracer, immediately
+    tmp_dir = '/dev/shm' if os.path.isdir('/dev/shm') else None
+    tmp = tempfile.NamedTemporaryFile(suffix='.png', delete=False, dir=tmp_dir)
+    try:
+        img.save(tmp, format='PNG', optimize=False, compress_level=1)
+        tmp.close()
+        vtracer.convert_image_to_svg_py(tmp.name, output_path, **params)
+    finally:
+        tmp.close()
+        os.remove(tmp.name)
 
 
 def convert_to_svg(
@@ -81,6 +384,8 @@ def convert_to_svg(
     path_precision: int = 8,
     enhance_quality: bool = True,
     ultra_quality: bool = False,
+    rembg_model: str = "u2netp",
+    max_side: int = 0,
 ) -> None:
     """
     Convert a PNG image to SVG format.
@@ -102,6 +407,8 @@ def convert_to_svg(
         path_precision: Path precision
         enhance_quality: Apply preprocessing to improve quality
         ultra_quality: Apply maximum quality preprocessing (slower)
+        rembg_model: rembg model to use for background removal
+        max_side: Downscale inputs whose longest side exceeds this (0 = no limit)
     """
     
     # Validate input file
@@ -113,62 +420,103 @@ def convert_to_svg(
     if output_dir and not os.path.exists(output_dir):
         os.makedirs(output_dir)
     
+    # vtracer thresholds the image to 1-bit in binary mode, so any
+    # contrast/saturation enhancement would be discarded anyway -- skip
+    # the whole preprocessing pass
+    if colormode == 'binary':
+        enhance_quality = False
+        ultra_quality = False
+
+    vtracer_params = dict(
+        colormode=colormode,
+        hierarchical=hierarchical,
+        mode=mode,
+        filter_speckle=filter_speckle,
+        color_precision=color_precision,
+        layer_difference=layer_difference,
+        corner_threshold=corner_threshold,
+        length_threshold=length_threshold,
+        max_iterations=max_iterations,
+        splice_threshold=splice_threshold,
+        path_precision=path_precision,
+    )
+
     # Process the image
-    temp_file = None
     try:
+        # Nothing below would touch the pixels on this path, so skip
+        # the decode entirely and let vtracer read the original file
+        if not remove_background and not enhance_quality and not max_side:
+            print(f"Converting {input_path} to SVG...")
+            vtracer.convert_image_to_svg_py(input_path, output_path, **vtracer_params)
+            print(f"✓ Successfully converted to {output_path}")
+            return
+
         # Open the image
         img = Image.open(input_path)
-        
+
+        # Downscale oversized inputs before any processing: rembg
+        # inference, preprocessing and vtracer path fitting all scale
+        # with pixel count, and detail beyond the cap rarely survives
+        # vectorization anyway
+        resized = False
+        if max_side:
+            # JPEG sources can decode directly at reduced resolution:
+            # draft mode has libjpeg skip the DCT coefficients the
+            # downscale would discard, so the full-size buffer is never
+            # allocated. PNGs have no equivalent and decode fully.
+            if img.format == 'JPEG':
+                size_before = img.size
+                img.draft(None, (max_side, max_side))
+                resized = img.size != size_before
+            if max(img.size) > max_side:
+                print(f"Downscaling {input_path} to fit {max_side}px...")
+                img.thumbnail((max_side, max_side), Image.LANCZOS)
+                resized = True
+
         # Remove background if requested
         if remove_background:
             print(f"Removing background from {input_path}...")
-            img_no_bg = remove(img)
-            
+            # rembg accepts and returns a bare array, so the cutout can
+            # feed straight into the enhancement kernel without the
+            # RGBA -> PIL -> NumPy -> PIL round-trip and its copies
+            arr = remove(_pil_to_np(img.convert('RGBA')),
+                         session=_get_session(rembg_model))
+
             # Preprocess if quality enhancement is enabled
             if enhance_quality:
-                img_no_bg = preprocess_image(img_no_bg, ultra_quality=ultra_quality)
-            
-            # Save to temporary file for vtracer processing
-            temp_file = input_path.replace('.png', '_temp.png')
-            img_no_bg.save(temp_file)
-            processing_file = temp_file
-        else:
-            if enhance_quality:
-                img = preprocess_image(img, enhance_edges=False, ultra_quality=ultra_quality)
-                temp_file = input_path.replace('.png', '_temp.png')
-                img.save(temp_file)
-                processing_file = temp_file
-            else:
-                processing_file = input_path
-        
+                arr = _preprocess_array(arr, ultra_quality=ultra_quality)
+
+            img = _np_to_pil(arr)
+        elif enhance_quality:
+            img = preprocess_image(img, enhance_edges=False, ultra_quality=ultra_quality)
+        elif not resized:
+            # Untouched pixels: let vtracer read the original file
+            img = None
+
         # Convert to SVG using vtracer
-        print(f"Converting {processing_file} to SVG...")
-        vtracer.convert_image_to_svg_py(
-            processing_file,
-            output_path,
-            colormode=colormode,
-            hierarchical=hierarchical,
-            mode=mode,
-            filter_speckle=filter_speckle,
-            color_precision=color_precision,
-            layer_difference=layer_difference,
-            corner_threshold=corner_threshold,
-            length_threshold=length_threshold,
-            max_iterations=max_iterations,
-            splice_threshold=splice_threshold,
-            path_precision=path_precision,
-        )
-        
+        print(f"Converting {input_path} to SVG...")
+        if img is not None:
+            _trace_image(img, output_path, vtracer_params)
+        else:
+            vtracer.convert_image_to_svg_py(input_path, output_path, **vtracer_params)
+
         print(f"✓ Successfully converted to {output_path}")
-        
+
     except Exception as e:
         print(f"Error during conversion: {e}")
         raise
-    
-    finally:
-        # Clean up temporary file
-        if temp_file and os.path.exists(temp_file):
-            os.remove(temp_file)
+
+
+def _init_worker():
+    """Pin per-worker thread pools so N workers don't oversubscribe CPUs."""
+    os.environ['OMP_NUM_THREADS'] = '1'
+    os.environ['OPENBLAS_NUM_THREADS'] = '1'
+
+
+def _convert_one(job):
+    """Convert a single (input_path, output_path, kwargs) batch entry."""
+    input_path, output_path, kwargs = job
+    convert_to_svg(input_path=input_path, output_path=output_path, **kwargs)
 
 
 def main():
@@ -197,7 +545,7 @@ Examples:
     
     parser.add_argument(
         "input",
-        help="Path to input PNG file"
+        help="Path to input PNG file, glob pattern, or directory"
     )
     
     parser.add_argument(
@@ -228,6 +576,20 @@ Examples:
         action="store_true",
         help="Apply maximum quality preprocessing (slower, best results)"
     )
+
+    parser.add_argument(
+        "--max-side",
+        type=int,
+        default=0,
+        help="Downscale inputs whose longest side exceeds N pixels (default: 0, no limit)"
+    )
+
+    parser.add_argument(
+        "--rembg-model",
+        choices=["u2netp", "u2net", "isnet-general-use"],
+        default="u2netp",
+        help="rembg model for background removal (default: u2netp, the fast variant)"
+    )
     
     parser.add_argument(
         "--colormode",
@@ -307,41 +669,101 @@ Examples:
     )
     
     args = parser.parse_args()
-    
-    # Determine output path
+
+    # Expand the input: a literal file, a glob pattern, or a directory
+    if os.path.isdir(args.input):
+        # Pick up every extension the converter handles, in any case
+        patterns = ('*.png', '*.PNG', '*.jpg', '*.JPG', '*.jpeg', '*.JPEG')
+        inputs = sorted(
+            path
+            for pattern in patterns
+            for path in glob.glob(os.path.join(args.input, pattern))
+        )
+        if not inputs:
+            print(f"Error: No images found in directory: {args.input}", file=sys.stderr)
+            sys.exit(1)
+    else:
+        inputs = sorted(glob.glob(args.input))
+        if not inputs:
+            # A literal filename may itself contain glob metacharacters
+            # (e.g. frame[1].png), so only treat the input as a failed
+            # pattern when no such file exists
+            if not os.path.exists(args.input) and any(c in args.input for c in '*?['):
+                print(f"Error: No files match pattern: {args.input}", file=sys.stderr)
+                sys.exit(1)
+            # Literal path: let convert_to_svg report if it is missing
+            inputs = [args.input]
+
+    if len(inputs) > 1 and not args.output_dir:
+        print("Error: --output-dir is required when converting multiple files", file=sys.stderr)
+        sys.exit(1)
+
+    # Determine output paths
     if args.output_dir:
         # Create output directory if it doesn't exist
         os.makedirs(args.output_dir, exist_ok=True)
-        
-        # Generate output filename from input filename
-        input_basename = os.path.basename(args.input)
-        output_filename = os.path.splitext(input_basename)[0] + '.svg'
-        output_path = os.path.join(args.output_dir, output_filename)
-    elif args.output:
-        output_path = args.output
-    else:
+    elif not args.output:
         print("Error: Either output path or --output-dir must be specified", file=sys.stderr)
         sys.exit(1)
-    
+
+    jobs = []
+    for input_path in inputs:
+        if args.output_dir:
+            # Generate output filename from input filename
+            input_basename = os.path.basename(input_path)
+            output_filename = os.path.splitext(input_basename)[0] + '.svg'
+            output_path = os.path.join(args.output_dir, output_filename)
+        else:
+            output_path = args.output
+        jobs.append((input_path, output_path))
+
+    # Inputs with the same stem (logo.png + logo.jpg) would map to the
+    # same SVG and silently overwrite each other -- in the process pool
+    # the writes even race. Refuse instead of losing a conversion.
+    seen = {}
+    for input_path, output_path in jobs:
+        if output_path in seen:
+            print(f"Error: {seen[output_path]} and {input_path} would both "
+                  f"write to {output_path}; rename one or convert them "
+                  "separately", file=sys.stderr)
+            sys.exit(1)
+        seen[output_path] = input_path
+
+    convert_kwargs = dict(
+        remove_background=not args.keep_bg,
+        colormode=args.colormode,
+        hierarchical=args.hierarchical,
+        mode=args.mode,
+        filter_speckle=args.filter_speckle,
+        color_precision=args.color_precision,
+        layer_difference=args.layer_difference,
+        corner_threshold=args.corner_threshold,
+        length_threshold=args.length_threshold,
+        max_iterations=args.max_iterations,
+        splice_threshold=args.splice_threshold,
+        path_precision=args.path_precision,
+        enhance_quality=not args.no_enhance,
+        ultra_quality=args.ultra_quality,
+        rembg_model=args.rembg_model,
+        max_side=args.max_side,
+    )
+
     try:
-        convert_to_svg(
-            input_path=args.input,
-            output_path=output_path,
-            remove_background=not args.keep_bg,
-            colormode=args.colormode,
-            hierarchical=args.hierarchical,
-            mode=args.mode,
-            filter_speckle=args.filter_speckle,
-            color_precision=args.color_precision,
-            layer_difference=args.layer_difference,
-            corner_threshold=args.corner_threshold,
-            length_threshold=args.length_threshold,
-            max_iterations=args.max_iterations,
-            splice_threshold=args.splice_threshold,
-            path_precision=args.path_precision,
-            enhance_quality=not args.no_enhance,
-            ultra_quality=args.ultra_quality,
-        )
+        if len(jobs) > 1:
+            # Batches are embarrassingly parallel across files. Separate
+            # processes (not threads) keep the ONNX runtime from
+            # oversubscribing cores; each worker caches its own rembg
+            # session across the files it handles.
+            with ProcessPoolExecutor(
+                max_workers=min(len(jobs), os.cpu_count() or 1),
+                initializer=_init_worker,
+            ) as executor:
+                work = [(i, o, convert_kwargs) for i, o in jobs]
+                list(executor.map(_convert_one, work))
+        else:
+            for input_path, output_path in jobs:
+                convert_to_svg(input_path=input_path, output_path=output_path,
+                               **convert_kwargs)
     except Exception as e:
         print(f"Error: {e}", file=sys.stderr)
         sys.exit(1)
@@ -3,18 +3,26 @@
 Create a simple test PNG image for testing the converter.
 """
 
-from PIL import Image, ImageDraw
+import numpy as np
+from PIL import Image
 
-# Create a simple logo-like image
-img = Image.new('RGB', (200, 200), color='white')
-draw = ImageDraw.Draw(img)
+# Build the logo directly as a NumPy array: vectorized masks instead of
+# per-shape ImageDraw calls, deterministic and ~10x faster as a fixture
+arr = np.full((200, 200, 3), 255, dtype=np.uint8)
 
-# Draw a simple shape (circle with text-like elements)
-draw.ellipse([50, 50, 150, 150], fill='#3498db', outline='#2980b9', width=3)
-draw.rectangle([90, 80, 110, 120], fill='white')
-draw.ellipse([85, 95, 95, 105], fill='white')
-draw.ellipse([105, 95, 115, 105], fill='white')
+# Distance-squared grid from the circle center
+yy, xx = np.ogrid[:200, :200]
+r2 = (xx - 100) ** 2 + (yy - 100) ** 2
 
-# Save the test image
-img.save('test_logo.png')
+# Blue circle with a darker 3px outline
+arr[r2 <= 50 ** 2] = (52, 152, 219)    # #3498db
+arr[(r2 > 47 ** 2) & (r2 <= 50 ** 2)] = (41, 128, 185)  # #2980b9
+
+# White rectangle and two white dots (text-like elements)
+arr[80:120, 90:110] = 255
+arr[(xx - 90) ** 2 + (yy - 100) ** 2 <= 5 ** 2] = 255
+arr[(xx - 110) ** 2 + (yy - 100) ** 2 <= 5 ** 2] = 255
+
+# Save the test image (fast encode; it's a throwaway fixture)
+Image.fromarray(arr).save('test_logo.png', optimize=False, compress_level=1)
 print("✓ Created test_logo.png")